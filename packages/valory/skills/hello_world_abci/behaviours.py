@@ -155,9 +155,7 @@ class SelectKeeperBehaviour(HelloWorldABCIBaseBehaviour, ABC):
 
         participants = sorted(self.synchronized_data.participants)
         random.seed(self.synchronized_data.most_voted_randomness, 2)  # nosec
-        index = random.randint(0, len(participants) - 1)  # nosec
-
-        keeper_address = participants[index]
+        keeper_address = random.choice(participants)  # nosec
 
         self.context.logger.info(f"Selected a new keeper: {keeper_address}.")
         payload = SelectKeeperPayload(self.context.agent_address, keeper_address)
@@ -185,21 +183,20 @@ class PrintMessageBehaviour(HelloWorldABCIBaseBehaviour, ABC):
         - Go to the next behaviour (set done event).
         """
 
-        if (
-            self.context.agent_address
-            == self.synchronized_data.most_voted_keeper_address
-        ):
-            message = self.params.hello_world_string
-            message = message + " The owners address is " + str(self.params.owner)
+        agent_address = self.context.agent_address
+        synchronized_data = self.synchronized_data
+
+        if agent_address == synchronized_data.most_voted_keeper_address:
+            message = self.params.keeper_message
         else:
             message = ":|"
 
-        printed_message = f"Agent {self.context.agent_name} (address {self.context.agent_address}) in period {self.synchronized_data.period_count} says: {message}"
+        printed_message = f"Agent {self.context.agent_name} (address {agent_address}) in period {synchronized_data.period_count} says: {message}"
 
         print(printed_message)
         self.context.logger.info(f"printed_message={printed_message}")
 
-        payload = PrintMessagePayload(self.context.agent_address, printed_message)
+        payload = PrintMessagePayload(agent_address, printed_message)
 
         yield from self.send_a2a_transaction(payload)
         yield from self.wait_until_round_end()
@@ -62,6 +62,9 @@ class HelloWorldParams(BaseParams):
         """Initialize the parameters."""
         self.hello_world_string: str = self._ensure("hello_world_message", kwargs, str)
         self.owner: str = self._ensure("owner", kwargs, str)
+        self.keeper_message: str = (
+            f"{self.hello_world_string} The owners address is {self.owner}"
+        )
         super().__init__(*args, **kwargs)
 
 
@@ -20,17 +20,20 @@
 
 from abc import ABC
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Type, cast
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Type, cast
 
 from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppInternalError,
     AbciApp,
     AbciAppTransitionFunction,
     AbstractRound,
     AppState,
     BaseSynchronizedData,
+    BaseTxPayload,
     CollectDifferentUntilAllRound,
     CollectSameUntilAllRound,
     CollectSameUntilThresholdRound,
+    _CollectUntilAllRound,
     get_name,
 )
 from packages.valory.skills.hello_world_abci.payloads import (
@@ -75,13 +78,104 @@ class HelloWorldABCIAbstractRound(AbstractRound, ABC):
 
     synchronized_data_class: Type[BaseSynchronizedData] = SynchronizedData
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the round."""
+        super().__init__(*args, **kwargs)
+        self._max_participants: Optional[int] = None
+        self._consensus_threshold: Optional[int] = None
+
     @property
     def synchronized_data(self) -> SynchronizedData:
         """Return the synchronized data."""
         return cast(SynchronizedData, self._synchronized_data)
 
+    @property
+    def max_participants(self) -> int:
+        """Get the number of all the participants, read once per round."""
+        # the synchronized data rebuilds the set of all the participants on each access
+        if self._max_participants is None:
+            self._max_participants = self.synchronized_data.max_participants
+        return self._max_participants
+
+    @property
+    def consensus_threshold(self) -> int:
+        """Get the consensus threshold, read once per round."""
+        if self._consensus_threshold is None:
+            self._consensus_threshold = self.synchronized_data.consensus_threshold
+        return self._consensus_threshold
+
+
+class HelloWorldCollectSameUntilThresholdRound(
+    CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound, ABC
+):
+    """
+    Abstract round collecting the same payload from a threshold of the agents.
+
+    The votes are tallied as the payloads arrive, so that the threshold and the
+    most voted payload are checked without recounting the whole collection.
+
+    Concrete rounds only need to set the payload class and the db keys.
+    """
+
+    done_event = Event.DONE
+    no_majority_event = Event.NO_MAJORITY
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the round."""
+        super().__init__(*args, **kwargs)
+        self._tally: Dict[Tuple[Any, ...], int] = {}
+        self._max: Tuple[Tuple[Any, ...], int] = ((), 0)
+        self._accepting_payloads_from: Optional[FrozenSet[str]] = None
 
-class RegistrationRound(CollectSameUntilAllRound, HelloWorldABCIAbstractRound):
+    @property
+    def accepting_payloads_from(self) -> FrozenSet[str]:
+        """Accepting from the active set, or also from (re)joiners"""
+        # the participants do not change while the round is running
+        if self._accepting_payloads_from is None:
+            self._accepting_payloads_from = super().accepting_payloads_from
+        return self._accepting_payloads_from
+
+    def process_payload(self, payload: BaseTxPayload) -> None:
+        """Process payload."""
+        super().process_payload(payload)
+
+        values = payload.values
+        count = self._tally[values] = self._tally.get(values, 0) + 1
+        if count > self._max[1]:
+            self._max = (values, count)
+
+    @property
+    def threshold_reached(
+        self,
+    ) -> bool:
+        """Check if the threshold has been reached."""
+        return self._max[1] >= self.consensus_threshold
+
+    @property
+    def most_voted_payload_values(
+        self,
+    ) -> Tuple[Any, ...]:
+        """Get the most voted payload values."""
+        most_voted_payload_values, max_votes = self._max
+        if max_votes < self.consensus_threshold:
+            raise ABCIAppInternalError("not enough votes")
+        return most_voted_payload_values
+
+
+class HelloWorldCollectUntilAllRound(
+    _CollectUntilAllRound, HelloWorldABCIAbstractRound, ABC
+):
+    """Abstract round collecting a payload from all the agents."""
+
+    @property
+    def collection_threshold_reached(
+        self,
+    ) -> bool:
+        """Check that the collection threshold has been reached."""
+        return len(self.collection) >= self.max_participants
+
+
+class RegistrationRound(CollectSameUntilAllRound, HelloWorldCollectUntilAllRound):
     """A round in which the agents get registered"""
 
     payload_class = RegistrationPayload
@@ -98,31 +192,23 @@ class RegistrationRound(CollectSameUntilAllRound, HelloWorldABCIAbstractRound):
         return None
 
 
-class CollectRandomnessRound(
-    CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound
-):
+class CollectRandomnessRound(HelloWorldCollectSameUntilThresholdRound):
     """A round for collecting randomness"""
 
     payload_class = CollectRandomnessPayload
-    synchronized_data_class = SynchronizedData
-    done_event = Event.DONE
-    no_majority_event = Event.NO_MAJORITY
     collection_key = get_name(SynchronizedData.participant_to_randomness)
     selection_key = get_name(SynchronizedData.most_voted_randomness)
 
 
-class SelectKeeperRound(CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound):
+class SelectKeeperRound(HelloWorldCollectSameUntilThresholdRound):
     """A round in a which keeper is selected"""
 
     payload_class = SelectKeeperPayload
-    synchronized_data_class = SynchronizedData
-    done_event = Event.DONE
-    no_majority_event = Event.NO_MAJORITY
     collection_key = get_name(SynchronizedData.participant_to_selection)
     selection_key = get_name(SynchronizedData.most_voted_keeper_address)
 
 
-class PrintMessageRound(CollectDifferentUntilAllRound, HelloWorldABCIAbstractRound):
+class PrintMessageRound(CollectDifferentUntilAllRound, HelloWorldCollectUntilAllRound):
     """A round in which the keeper prints the message"""
 
     payload_class = PrintMessagePayload
@@ -133,10 +219,8 @@ class PrintMessageRound(CollectDifferentUntilAllRound, HelloWorldABCIAbstractRou
             synchronized_data = self.synchronized_data.update(
                 participants=tuple(sorted(self.collection)),
                 printed_messages=sorted(
-                    [
-                        cast(PrintMessagePayload, payload).message
-                        for payload in self.collection.values()
-                    ]
+                    cast(PrintMessagePayload, payload).message
+                    for payload in self.collection.values()
                 ),
                 synchronized_data_class=SynchronizedData,
             )
@@ -144,7 +228,7 @@ class PrintMessageRound(CollectDifferentUntilAllRound, HelloWorldABCIAbstractRou
         return None
 
 
-class ResetAndPauseRound(CollectSameUntilThresholdRound, HelloWorldABCIAbstractRound):
+class ResetAndPauseRound(HelloWorldCollectSameUntilThresholdRound):
     """This class represents the base reset round."""
 
     payload_class = ResetPayload
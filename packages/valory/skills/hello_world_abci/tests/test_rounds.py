@@ -23,9 +23,13 @@
 
 import logging  # noqa: F401
 from typing import cast
-from unittest.mock import MagicMock
+from unittest import mock
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
 
 from packages.valory.skills.abstract_round_abci.base import (
+    ABCIAppInternalError,
     AbciAppDB,
     CollectionRound,
     MAX_INT_256,
@@ -194,6 +198,92 @@ class TestSelectKeeperRound(BaseRoundTestClass):
         )
         assert event == Event.DONE
 
+    def test_tally(
+        self,
+    ) -> None:
+        """Test that the votes are tallied as the payloads arrive."""
+
+        test_round = SelectKeeperRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        keepers = ("keeper_a", "keeper_b", "keeper_b", "keeper_b")
+        payloads = [
+            SelectKeeperPayload(sender=participant, keeper=keeper)
+            for participant, keeper in zip(sorted(self.participants), keepers)
+        ]
+
+        for payload in payloads[:2]:
+            test_round.process_payload(payload)
+        assert test_round.accepting_payloads_from == self.participants
+        assert test_round.accepting_payloads_from is test_round.accepting_payloads_from
+        assert not test_round.threshold_reached
+        with pytest.raises(ABCIAppInternalError, match="not enough votes"):
+            _ = test_round.most_voted_payload
+
+        for payload in payloads[2:]:
+            test_round.process_payload(payload)
+        assert test_round.threshold_reached
+        assert test_round.most_voted_payload == "keeper_b"
+
+        with pytest.raises(ABCIAppInternalError, match="has already sent value"):
+            test_round.process_payload(payloads[0])
+        with pytest.raises(ABCIAppInternalError, match="has already sent value"):
+            test_round.process_payload(
+                SelectKeeperPayload(sender=payloads[0].sender, keeper="keeper_b")
+            )
+        assert test_round.collection[payloads[0].sender] is payloads[0]
+        assert test_round.most_voted_payload == "keeper_b"
+
+    def test_participants_read_once(
+        self,
+    ) -> None:
+        """Test that the number of participants and the threshold are read once per round."""
+
+        test_round = SelectKeeperRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        with mock.patch.object(
+            SynchronizedData,
+            "max_participants",
+            new_callable=PropertyMock,
+            return_value=MAX_PARTICIPANTS,
+        ) as max_participants, mock.patch.object(
+            SynchronizedData,
+            "consensus_threshold",
+            new_callable=PropertyMock,
+            return_value=3,
+        ) as consensus_threshold:
+            for _ in range(2):
+                assert test_round.max_participants == MAX_PARTICIPANTS
+                assert test_round.consensus_threshold == 3
+                assert not test_round.threshold_reached
+
+        max_participants.assert_called_once()
+        consensus_threshold.assert_called_once()
+
+    def test_majority_not_possible(
+        self,
+    ) -> None:
+        """Test that a split vote ends the round without a majority."""
+
+        test_round = SelectKeeperRound(
+            synchronized_data=self.synchronized_data,
+            context=MagicMock(),
+        )
+        keepers = ("keeper_a", "keeper_b", "keeper_c")
+        for participant, keeper in zip(sorted(self.participants), keepers):
+            test_round.process_payload(
+                SelectKeeperPayload(sender=participant, keeper=keeper)
+            )
+
+        assert not test_round.threshold_reached
+        res = test_round.end_block()
+        assert res is not None
+        _, event = res
+        assert event == Event.NO_MAJORITY
+
 
 class TestPrintMessageRound(BaseRoundTestClass):
     """Tests for PrintMessageRound."""